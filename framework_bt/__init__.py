@@ -16,11 +16,12 @@ Example usage:
 Currently exported:
 -------------------
 - extract: UTXO extractor function from multiple data sources.
+- extract_batches: same pipeline, yielding one Arrow RecordBatch per block.
 
 More components (sources, classifiers) can be imported directly from submodules.
 """
 
-from .extractor import extract
+from .extractor import extract, extract_batches
 
-__all__ = ["extract"]
+__all__ = ["extract", "extract_batches"]
 __version__ = "0.0.2"
@@ -2,11 +2,12 @@ import os
 import struct
 import json
 import multiprocessing
-from bitcoin.core import CBlock
 from typing import Iterator, Optional
 from tqdm import tqdm
 from pathlib import Path
 
+from .blockparser import block_hash
+
 MAGIC_BYTES = b"\xf9\xbe\xb4\xd9"
 MAGIC_LEN = 4
 LENGTH_LEN = 4
@@ -88,11 +89,11 @@ class BlkFileSource:
                     continue
                 block_size = struct.unpack("<I", raw_len)[0]
                 raw_block = f.read(block_size)
-                blk_hash = CBlock.deserialize(raw_block).GetHash()
+                blk_hash = block_hash(raw_block)
                 bar.update(1)
                 yield {
                     "height": int(h),
-                    "hash": blk_hash.hex(),
+                    "hash": blk_hash,
                     "raw": raw_block,
                 }
         bar.close()
@@ -124,10 +125,10 @@ def _process_file_for_range(args):
                 continue
             if global_height > end_height:
                 break
-            blk_hash = CBlock.deserialize(raw_block).GetHash()
+            blk_hash = block_hash(raw_block)
             results.append({
                 "height": global_height,
-                "hash": blk_hash.hex(),
+                "hash": blk_hash,
                 "raw": raw_block,
             })
             local_count += 1
@@ -190,10 +191,10 @@ class ParallelBlkFileSource:
                         continue
                     block_size = struct.unpack("<I", raw_len)[0]
                     raw_block = f.read(block_size)
-                    blk_hash = CBlock.deserialize(raw_block).GetHash()
+                    blk_hash = block_hash(raw_block)
                     out.append({
                         "height": int(h),
-                        "hash": blk_hash.hex(),
+                        "hash": blk_hash,
                         "raw": raw_block,
                     })
             except Exception:
@@ -5,7 +5,8 @@ import struct
 from pathlib import Path
 from tqdm import tqdm
 from typing import Dict
-from bitcoin.core import CBlock
+
+from .blockparser import block_hash
 
 MAGIC = b"\xf9\xbe\xb4\xd9"
 MAGIC_LEN = 4
@@ -50,12 +51,7 @@ def build_blk_index(blk_dir: str, save_path: str = None) -> Dict[int, dict]:
                 if len(raw_block) < block_size:
                     break
 
-                try:
-                    blk_hash = CBlock.deserialize(raw_block).GetHash().hex()
-                except Exception:
-                    offset += 1
-                    f.seek(offset)
-                    continue
+                blk_hash = block_hash(raw_block)
 
                 index[height] = {
                     "file": path.name,
@@ -0,0 +1,171 @@
+"""
+blockparser.py
+==============
+Single-pass, zero-copy parser for raw serialized blocks and transactions.
+
+The raw block is walked once through a `memoryview`; nothing is copied
+except the bytes that are hashed.  For every transaction it produces:
+
+    • txid        : sha256d over the non-witness byte spans (hex, display order)
+    • vin_count   : number of inputs
+    • outputs     : list of (value, scriptPubKey) with scripts as memoryviews
+    • is_coinbase : first input spends the null outpoint
+    • is_segwit   : at least one input carries a non-empty witness
+    • base_size / total_size / weight  (BIP141, straight from byte offsets)
+
+It replaces the `CBlock.deserialize` → `tx.serialize().hex()` →
+`CTransaction.deserialize` round trip that python-bitcoinlib forced on the
+extract hot path.
+"""
+
+from __future__ import annotations
+
+import struct
+from hashlib import sha256
+from typing import Iterator, List, NamedTuple, Tuple
+
+HEADER_LEN = 80
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+
+_NULL_HASH = b"\x00" * 32
+_NULL_INDEX = 0xFFFFFFFF
+
+
+# ───────────────────────────────────────────────────────────────────
+#  Low-level helpers
+# ───────────────────────────────────────────────────────────────────
+def sha256d(data) -> bytes:
+    """Double SHA-256 (internal byte order)."""
+    return sha256(sha256(data).digest()).digest()
+
+
+def read_varint(buf, pos: int) -> Tuple[int, int]:
+    """Reads a CompactSize integer at `pos`. Returns (value, new_pos)."""
+    n = buf[pos]
+    if n < 0xFD:
+        return n, pos + 1
+    if n == 0xFD:
+        return _U16.unpack_from(buf, pos + 1)[0], pos + 3
+    if n == 0xFE:
+        return _U32.unpack_from(buf, pos + 1)[0], pos + 5
+    return _U64.unpack_from(buf, pos + 1)[0], pos + 9
+
+
+def block_hash(raw) -> str:
+    """Block hash (hex, display order) = sha256d of the 80-byte header."""
+    return sha256d(memoryview(raw)[:HEADER_LEN])[::-1].hex()
+
+
+def block_time(raw) -> int:
+    """UNIX timestamp stored in the block header."""
+    return _U32.unpack_from(raw, 68)[0]
+
+
+# ───────────────────────────────────────────────────────────────────
+#  Transaction view
+# ───────────────────────────────────────────────────────────────────
+class TxView(NamedTuple):
+    txid: str
+    vin_count: int
+    outputs: List[Tuple[int, memoryview]]
+    is_coinbase: bool
+    is_segwit: bool
+    base_size: int
+    total_size: int
+    weight: int
+
+
+def parse_tx(buf, pos: int = 0) -> Tuple[TxView, int]:
+    """
+    Parses one serialized transaction starting at `pos`.
+    Returns (TxView, position right after the transaction).
+    """
+    mv = buf if isinstance(buf, memoryview) else memoryview(buf)
+    start = pos
+    pos += 4  # nVersion
+
+    has_witness = mv[pos] == 0 and mv[pos + 1] == 1
+    if has_witness:
+        pos += 2  # marker + flag
+    body_start = pos
+
+    # ----- inputs ----------------------------------------------------
+    vin_count, pos = read_varint(mv, pos)
+    is_coinbase = vin_count == 0
+    for i in range(vin_count):
+        if i == 0:
+            is_coinbase = (
+                mv[pos:pos + 32] == _NULL_HASH
+                and _U32.unpack_from(mv, pos + 32)[0] == _NULL_INDEX
+            )
+        script_len, pos = read_varint(mv, pos + 36)
+        pos += script_len + 4  # scriptSig + nSequence
+
+    # ----- outputs ---------------------------------------------------
+    vout_count, pos = read_varint(mv, pos)
+    outputs = []
+    for _ in range(vout_count):
+        value = _I64.unpack_from(mv, pos)[0]
+        script_len, pos = read_varint(mv, pos + 8)
+        outputs.append((value, mv[pos:pos + script_len]))
+        pos += script_len
+    body_end = pos
+
+    # ----- witness ---------------------------------------------------
+    is_segwit = False
+    if has_witness:
+        for _ in range(vin_count):
+            items, pos = read_varint(mv, pos)
+            if items:
+                is_segwit = True
+            for _ in range(items):
+                item_len, pos = read_varint(mv, pos)
+                pos += item_len
+
+    lock_pos = pos
+    end = pos + 4  # nLockTime
+
+    h = sha256()
+    h.update(mv[start:start + 4])
+    h.update(mv[body_start:body_end])
+    h.update(mv[lock_pos:end])
+    txid = sha256(h.digest()).digest()[::-1].hex()
+
+    base_size = 4 + (body_end - body_start) + 4
+    total_size = end - start if is_segwit else base_size
+
+    return TxView(
+        txid=txid,
+        vin_count=vin_count,
+        outputs=outputs,
+        is_coinbase=is_coinbase,
+        is_segwit=is_segwit,
+        base_size=base_size,
+        total_size=total_size,
+        weight=base_size * 3 + total_size,
+    ), end
+
+
+def iter_block_txs(raw) -> Iterator[TxView]:
+    """Yields a TxView for every transaction of a raw block, in order."""
+    mv = memoryview(raw)
+    tx_count, pos = read_varint(mv, HEADER_LEN)
+    for _ in range(tx_count):
+        tx, pos = parse_tx(mv, pos)
+        yield tx
+
+
+def split_block_txs(raw) -> List[memoryview]:
+    """Returns the serialized byte span of every transaction of a raw block."""
+    mv = memoryview(raw)
+    tx_count, pos = read_varint(mv, HEADER_LEN)
+    spans = []
+    for _ in range(tx_count):
+        _, end = parse_tx(mv, pos)
+        spans.append(mv[pos:end])
+        pos = end
+    return spans
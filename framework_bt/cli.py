@@ -9,14 +9,15 @@
 #   • mempool.space API      (--mempool)
 
 from __future__ import annotations
-import click, pandas as pd, pyarrow as pa, pyarrow.parquet as pq
+import click
 
 from .rpcsource     import RpcSource
 from .p2psource     import P2PSource
 from .mempoolsource import MempoolApiSource
 from .blkfile       import BlkFileSource, ParallelBlkFileSource
 from .classifier    import StandardClassifier
-from .extractor     import extract
+from .extractor     import extract_batches
+from .writer        import COMPRESSIONS, ParquetChunkWriter
 
 
 @click.command()
@@ -43,15 +44,23 @@ from .extractor     import extract
               help="Enable parallel reading of blk*.dat files")
 @click.option("--processes", type=int, default=4, show_default=True,
               help="Number of processes for deserialization")
+@click.option("--max-inflight", type=int, default=None,
+              help="Maximum blocks being decoded at once [default: 4 × processes]")
+@click.option("--unordered", is_flag=True,
+              help="Write blocks in completion order instead of height order")
 # ───────────── Output ──────────────
 @click.option("--output", type=str, default="utxos", show_default=True,
               help="Prefix for output Parquet files")
 @click.option("--chunk-size", type=int, default=1_000_000, show_default=True,
               help="Number of UTXOs per Parquet file")
+@click.option("--compression", type=click.Choice(COMPRESSIONS), default="snappy",
+              show_default=True, help="Parquet compression codec")
+@click.option("--row-group-size", type=int, default=131_072, show_default=True,
+              help="Rows per Parquet row group")
 def main(blk_dir, rpc, rpc_url, p2p, peer_ip, mempool,
          start_height, end_height,
-         parallel, processes,
-         output, chunk_size):
+         parallel, processes, max_inflight, unordered,
+         output, chunk_size, compression, row_group_size):
     """Extracts and classifies UTXOs, saving them in Parquet chunks."""
 
     # ── Ensure only one source is selected ─────────────────────────────
@@ -79,31 +88,22 @@ def main(blk_dir, rpc, rpc_url, p2p, peer_ip, mempool,
 
     # ── Extraction + Writing to Parquet ────────────────────────────────
     classifier = StandardClassifier()
-    buffer = []
-    chunk_idx = 1
-    total = 0
-
-    for utxo in extract(source, classifier, processes=processes,
-                        start_height=start_height, end_height=end_height):
-        buffer.append(utxo)
-        if len(buffer) >= chunk_size:
-            _write_chunk(buffer, output, chunk_idx)
-            total += len(buffer)
-            buffer.clear()
-            chunk_idx += 1
-
-    if buffer:
-        _write_chunk(buffer, output, chunk_idx)
-        total += len(buffer)
-
-    click.echo(f"[✓] {total} UTXOs saved to {chunk_idx} file(s)")
-
-
-# ───────── Helper to write Parquet files ─────────
-def _write_chunk(buf, prefix, idx):
-    pq.write_table(pa.Table.from_pandas(pd.DataFrame(buf)),
-                   f"{prefix}_{idx:04d}.parquet")
-    click.echo(f"[→] {len(buf)} UTXOs → {prefix}_{idx:04d}.parquet")
+    writer = ParquetChunkWriter(output, chunk_size=chunk_size,
+                                compression=compression,
+                                row_group_size=row_group_size,
+                                on_file=_report_chunk)
+    with writer:
+        for batch in extract_batches(source, classifier, processes=processes,
+                                     start_height=start_height, end_height=end_height,
+                                     max_inflight=max_inflight, ordered=not unordered):
+            writer.write(batch)
+
+    click.echo(f"[✓] {writer.total_rows} UTXOs saved to {len(writer.files)} file(s)")
+
+
+# ───────── Progress line for every Parquet file written ─────────
+def _report_chunk(path: str, rows: int):
+    click.echo(f"[→] {rows} UTXOs → {path}")
 
 
 if __name__ == "__main__":
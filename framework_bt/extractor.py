@@ -1,169 +1,211 @@
 # extractor.py
 # ───────────────────────────────────────────────────────────────────
 from __future__ import annotations
-from concurrent.futures import ProcessPoolExecutor
-from typing import Iterable, List, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional
 
+import pyarrow as pa
 from tqdm import tqdm
-from bitcoin.core import CBlock, CTransaction, b2lx
 
+from .blockparser import TxView, block_time, iter_block_txs, parse_tx
 from .classifier import StandardClassifier
+from .schema import UTXO_SCHEMA
 
 
 # ───────────────────────────────────────────────────────────────────
-#  Utilidades de metadatos de transacción
+#  Bloque → lote columnar (se ejecuta en los workers)
 # ───────────────────────────────────────────────────────────────────
-def _analyze_tx_metadata(tx: CTransaction) -> dict:
+_WORKER_CLASSIFIER: Optional[StandardClassifier] = None
+
+
+def _init_worker(classifier: StandardClassifier) -> None:
+    """Inicializador del pool: cada worker recibe el clasificador una sola vez."""
+    global _WORKER_CLASSIFIER
+    _WORKER_CLASSIFIER = classifier
+
+
+def _txs_to_batch(
+    height: int,
+    blk_time: Optional[int],
+    txs: Iterable[TxView],
+    classifier: StandardClassifier,
+) -> pa.RecordBatch:
     """
-    Devuelve:
-        - is_segwit   : bool
-        - base_size   : bytes sin testigo
-        - total_size  : bytes totales
-        - weight      : weight units (= base*3 + total)
+    Clasifica todas las salidas de un bloque y las devuelve como un
+    RecordBatch con el esquema UTXO_SCHEMA (una fila por salida).
     """
-    try:
-        raw_total = tx.serialize()
-
-        # ¿Tiene datos de testigo?
-        is_segwit = hasattr(tx, "wit") and tx.wit and not tx.wit.is_null()
-
-        # Base size = tamaño sin el campo witness
-        try:
-            tx_no_wit = tx.copy()
-            tx_no_wit.wit = None
-            raw_base = tx_no_wit.serialize()
-            base_size = len(raw_base)
-        except Exception:
-            base_size = len(raw_total)  # Fallback
-
-        total_size = len(raw_total)
-        weight = base_size * 3 + total_size
-
-        return {
-            "is_segwit": is_segwit,
-            "base_size": base_size,
-            "total_size": total_size,
-            "weight": weight,
-        }
-
-    except Exception:
-        # Algo fue mal al serializar → devolvemos None
-        return {
-            "is_segwit": None,
-            "base_size": None,
-            "total_size": None,
-            "weight": None,
-        }
+    tx_id, vout, value, vin_count, types = [], [], [], [], []
+    is_segwit, base_size, total_size, weight = [], [], [], []
+
+    for tx in txs:
+        n = len(tx.outputs)
+        tx_id.extend([tx.txid] * n)
+        vin_count.extend([tx.vin_count] * n)
+        is_segwit.extend([tx.is_segwit] * n)
+        base_size.extend([tx.base_size] * n)
+        total_size.extend([tx.total_size] * n)
+        weight.extend([tx.weight] * n)
+        for idx, (val, script) in enumerate(tx.outputs):
+            vout.append(idx)
+            value.append(val)
+            types.append(classifier.classify(script.hex(), coinbase=tx.is_coinbase))
+
+    rows = len(vout)
+    columns = [
+        [height] * rows,
+        [blk_time] * rows,
+        tx_id, vout, value, vin_count, types,
+        is_segwit, base_size, total_size, weight,
+    ]
+    return pa.RecordBatch.from_arrays(
+        [pa.array(col, type=field.type) for col, field in zip(columns, UTXO_SCHEMA)],
+        schema=UTXO_SCHEMA,
+    )
+
+
+def _decode_block(
+    height: int,
+    raw_block: bytes,
+    classifier: Optional[StandardClassifier] = None,
+) -> pa.RecordBatch:
+    """Recorre el bloque bruto una sola vez: parseo + clasificación + metadatos."""
+    return _txs_to_batch(
+        height,
+        block_time(raw_block),  # ← timestamp UNIX del bloque
+        iter_block_txs(raw_block),
+        classifier or _WORKER_CLASSIFIER,
+    )
+
+
+def _parse_hex_txs(txs_hex: List[str]) -> List[TxView]:
+    """Convierte una lista de transacciones hex (RpcSource) en TxView."""
+    return [parse_tx(bytes.fromhex(tx_hex))[0] for tx_hex in txs_hex]
 
 
 # ───────────────────────────────────────────────────────────────────
-#  Deserialización de bloques en paralelo
+#  Ventana de bloques en vuelo
 # ───────────────────────────────────────────────────────────────────
-def _deserialize_block(raw_block: bytes) -> List[str]:
-    """Convierte un bloque bruto en lista de transacciones hex."""
-    block = CBlock.deserialize(raw_block)
-    return {
-        "txs": [tx.serialize().hex() for tx in block.vtx],
-        "time": block.nTime  # ← timestamp UNIX del bloque
-    }
+def _submit(
+    pool: ProcessPoolExecutor | None,
+    blk: dict,
+    classifier: StandardClassifier,
+) -> Future:
+    """Lanza la decodificación de un bloque; devuelve siempre un Future."""
+    if "txs" in blk:  # RpcSource: transacciones ya separadas en hex
+        fut = Future()
+        fut.set_result(_txs_to_batch(blk["height"], blk.get("time"),
+                                     _parse_hex_txs(blk["txs"]), classifier))
+        return fut
+    if pool is None:
+        fut = Future()
+        fut.set_result(_decode_block(blk["height"], blk["raw"], classifier))
+        return fut
+    return pool.submit(_decode_block, blk["height"], blk["raw"])
+
+
+def _ready(pending: deque, *, ordered: bool, block: bool) -> List[tuple]:
+    """
+    Saca de `pending` los bloques ya decodificados.
+
+    - ordered=True  → solo la cabeza de la ventana (orden de la fuente)
+    - ordered=False → cualquiera que haya terminado (orden de finalización)
+    - block=True    → espera hasta que al menos uno esté listo
+    """
+    if ordered:
+        if block and pending:
+            pending[0][0].result()
+        out = []
+        while pending and pending[0][0].done():
+            out.append(pending.popleft())
+        return out
+
+    if block and pending:
+        wait([fut for fut, _ in pending], return_when=FIRST_COMPLETED)
+    out = [entry for entry in pending if entry[0].done()]
+    if out:
+        keep = [entry for entry in pending if not entry[0].done()]
+        pending.clear()
+        pending.extend(keep)
+    return out
+
 
 # ───────────────────────────────────────────────────────────────────
-#  Función pública: extract(...)
+#  Funciones públicas: extract_batches(...) / extract(...)
 # ───────────────────────────────────────────────────────────────────
-def extract(
+def extract_batches(
     source: Iterable[dict],
     classifier: StandardClassifier,
     *,
     processes: int = 4,
     start_height: Optional[int] = None,
     end_height:   Optional[int] = None,
-):
+    max_inflight: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[pa.RecordBatch]:
     """
-    Recorre un iterador de bloques y produce UTXOs clasificados.
+    Recorre un iterador de bloques y produce un RecordBatch de UTXOs
+    clasificados por bloque (esquema `UTXO_SCHEMA`).
 
     Cada elemento `blk` de `source` debe contener:
         - 'height' : int
         - 'raw'    : bytes  (bloque bruto)     O  'txs': list[str] (hex txs)
 
-    Devuelve un generador de dicts con:
-        height, tx_id, vout, value,
-        vin_count, type,
-        is_segwit, base_size, total_size, weight
+    Los workers hacen todo el trabajo (parseo, clasificación y metadatos)
+    y devuelven lotes columnares; el proceso padre solo los reenvía.
+
+    Como mucho `max_inflight` bloques (por defecto 4 × processes) están
+    pendientes a la vez: si la ventana se llena, se deja de leer la fuente
+    hasta que salga un resultado.  Los lotes se emiten en cuanto su bloque
+    está listo, en el orden de la fuente (`ordered=True`) o en orden de
+    finalización (`ordered=False`).
     """
     pool: ProcessPoolExecutor | None = None
     if processes > 1:
-        pool = ProcessPoolExecutor(max_workers=processes)
+        pool = ProcessPoolExecutor(max_workers=processes,
+                                   initializer=_init_worker,
+                                   initargs=(classifier,))
 
-    futures = []
+    window = max(1, max_inflight or 4 * max(1, processes))
+    pending: deque = deque()
     bar = tqdm(total=0, desc="BLKS", unit="blk", dynamic_ncols=True)
 
-    for blk in source:
-        h = blk["height"]
-        if start_height is not None and h < start_height:
-            continue
-        if end_height   is not None and h > end_height:
-            continue
-
-        if "txs" in blk:
+    def _emit(done):
+        for fut, _ in done:
             bar.update(1)
-            yield from _yield_utxos(blk, classifier)
-        else:
-            # Deserializar en otro proceso
-            fut = pool.submit(_deserialize_block, blk["raw"])
-            futures.append((fut, blk))
+            yield fut.result()
+
+    try:
+        for blk in source:
+            h = blk["height"]
+            if start_height is not None and h < start_height:
+                continue
+            if end_height   is not None and h > end_height:
+                continue
+
+            pending.append((_submit(pool, blk, classifier), h))
             bar.total += 1
             bar.refresh()
 
-    # Recolectar los resultados pendientes
-    for fut, meta in futures:
-        result = fut.result()
-        meta["txs"]  = result["txs"]
-        meta["time"] = result["time"]   # ← aquí guardamos timestamp
-        bar.update(1)
-        yield from _yield_utxos(meta, classifier)
+            # Emitir lo que ya esté listo; bloquear solo si la ventana está llena
+            yield from _emit(_ready(pending, ordered=ordered,
+                                    block=len(pending) >= window))
 
-    bar.close()
-    if pool:
-        pool.shutdown()
+        # Vaciar la ventana
+        while pending:
+            yield from _emit(_ready(pending, ordered=ordered, block=True))
+    finally:
+        bar.close()
+        if pool:
+            pool.shutdown(cancel_futures=True)
 
 
-# ───────────────────────────────────────────────────────────────────
-#  Produce UTXOs de un bloque (incluye vin_count)
-# ───────────────────────────────────────────────────────────────────
-def _yield_utxos(blk: dict, classifier: StandardClassifier):
+def extract(source: Iterable[dict], classifier: StandardClassifier, **kwargs):
     """
-    Extrae todas las salidas (UTXOs) de un bloque y las clasifica.
-    Añade:
-        - vin_count : número de entradas de la transacción
-        - time      : timestamp UNIX del bloque
+    Igual que `extract_batches` pero produce un dict por UTXO:
+        height, time, tx_id, vout, value,
+        vin_count, type,
+        is_segwit, base_size, total_size, weight
     """
-    height = blk["height"]
-    blk_time = blk.get("time")   # ← timestamp ya disponible
-
-    for tx_hex in blk["txs"]:
-        tx  = CTransaction.deserialize(bytes.fromhex(tx_hex))
-        txid = b2lx(tx.GetTxid())
-
-        is_coinbase = (
-            len(tx.vin) == 0
-            or (
-                tx.vin[0].prevout.hash == b"\x00" * 32
-                and tx.vin[0].prevout.n == 0xFFFFFFFF
-            )
-        )
-
-        tx_meta   = _analyze_tx_metadata(tx)
-        vin_count = len(tx.vin)
-
-        for idx, out in enumerate(tx.vout):
-            yield {
-                "height":   height,
-                "time":     blk_time,      # ← lo incluimos aquí
-                "tx_id":    txid,
-                "vout":     idx,
-                "value":    out.nValue,
-                "vin_count": vin_count,
-                "type":     classifier.classify(out.scriptPubKey.hex(),
-                                               coinbase=is_coinbase),
-                **tx_meta
-            }
+    for batch in extract_batches(source, classifier, **kwargs):
+        yield from batch.to_pylist()
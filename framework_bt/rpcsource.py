@@ -13,9 +13,10 @@ from __future__ import annotations
 import binascii
 from typing import Dict, Iterable, Optional
 
-from bitcoin.core import CBlock
 from bitcoinrpc.authproxy import AuthServiceProxy, JSONRPCException
 
+from .blockparser import split_block_txs
+
 
 class NodeSyncing(RuntimeError):
     """The RPC node is still starting up / verifying (-28)."""
@@ -71,11 +72,10 @@ class RpcSource:
         """Returns a block {height, hash, txs[]} for the given hash."""
         raw_hex = _safe_rpc(self.rpc.getblock, blk_hash, 0)  # 0 = hex response
         raw = binascii.unhexlify(raw_hex)
-        block = CBlock.deserialize(raw)
         height = _safe_rpc(self.rpc.getblockheader, blk_hash)["height"]
 
         return {
             "height": height,
             "hash": blk_hash,
-            "txs": [tx.serialize().hex() for tx in block.vtx],
+            "txs": [tx.hex() for tx in split_block_txs(raw)],
         }
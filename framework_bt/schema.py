@@ -0,0 +1,25 @@
+"""
+schema.py
+=========
+Arrow schema of the UTXO rows produced by `extract_batches()` and written
+to Parquet by `bt-extract`.  One row per transaction output.
+
+Integer columns use the narrowest type that fits the consensus limits and
+`type` is dictionary-encoded, since it only takes a dozen distinct values.
+"""
+
+import pyarrow as pa
+
+UTXO_SCHEMA = pa.schema([
+    ("height",     pa.uint32()),
+    ("time",       pa.uint32()),   # block timestamp (UNIX)
+    ("tx_id",      pa.string()),
+    ("vout",       pa.uint32()),
+    ("value",      pa.int64()),    # satoshis (signed in the serialization)
+    ("vin_count",  pa.uint32()),
+    ("type",       pa.dictionary(pa.int8(), pa.string())),
+    ("is_segwit",  pa.bool_()),
+    ("base_size",  pa.uint32()),
+    ("total_size", pa.uint32()),
+    ("weight",     pa.uint32()),
+])
@@ -0,0 +1,169 @@
+"""
+writer.py
+=========
+Arrow-native Parquet output for `bt-extract`.
+
+`ParquetChunkWriter` appends UTXO record batches to files named
+`<prefix>_NNNN.parquet`, each holding at most `chunk_size` rows.  Batches
+are handed to a background thread through a bounded queue; that thread
+assembles row groups and writes them with `pq.ParquetWriter`, so the
+extraction loop never waits for compression or disk I/O and no
+intermediate pandas / Python-dict copies are made.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .schema import UTXO_SCHEMA
+
+COMPRESSIONS = ("snappy", "zstd", "gzip", "brotli", "lz4", "none")
+
+_STOP = None
+
+
+class ParquetChunkWriter:
+    """Background, incremental writer of UTXO batches to Parquet chunks."""
+
+    def __init__(
+        self,
+        prefix: str,
+        *,
+        chunk_size: int = 1_000_000,
+        compression: str = "snappy",
+        row_group_size: int = 131_072,
+        schema: pa.Schema = UTXO_SCHEMA,
+        queue_size: int = 64,
+        on_file: Optional[Callable[[str, int], None]] = None,
+    ) -> None:
+        """
+        :param chunk_size:     maximum rows per output file.
+        :param compression:    Parquet codec (one of COMPRESSIONS).
+        :param row_group_size: rows per Parquet row group.
+        :param queue_size:     batches that may wait for the writer thread
+                               before `write()` blocks (backpressure).
+        :param on_file:        callback(path, rows) run after each file is closed.
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.prefix = prefix
+        self.chunk_size = max(1, chunk_size)
+        self.compression = None if compression == "none" else compression
+        self.row_group_size = max(1, min(row_group_size, self.chunk_size))
+        self.schema = schema
+        self.on_file = on_file
+
+        self.files: List[Tuple[str, int]] = []
+        self.total_rows = 0
+
+        self._idx = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._path: Optional[str] = None
+        self._file_rows = 0
+        self._pending: List[pa.RecordBatch] = []
+        self._pending_rows = 0
+
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._thread = threading.Thread(target=self._run, name="parquet-writer",
+                                        daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    def write(self, batch: pa.RecordBatch) -> None:
+        """Queues a batch for writing (blocks only if the queue is full)."""
+        self._raise_if_failed()
+        if batch.num_rows:
+            if not batch.schema.equals(self.schema):
+                batch = pa.Table.from_batches([batch]).cast(self.schema).combine_chunks().to_batches()[0]
+            self._queue.put(batch)
+
+    def close(self) -> None:
+        """Flushes everything still queued and closes the current file."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_if_failed()
+
+    def __enter__(self) -> "ParquetChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:  # don't mask the original error with a writer error
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------ #
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Parquet writer thread failed") from self._error
+
+    def _run(self) -> None:
+        stopped = False
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is _STOP:
+                    stopped = True
+                    break
+                self._append(batch)
+            self._flush_row_group()
+            self._close_file()
+        except BaseException as exc:
+            self._error = exc
+            if self._writer is not None:
+                self._writer.close()
+            # Keep draining so producers blocked on put() can finish
+            while not stopped:
+                stopped = self._queue.get() is _STOP
+
+    def _append(self, batch: pa.RecordBatch) -> None:
+        offset = 0
+        while offset < batch.num_rows:
+            room = self.chunk_size - self._file_rows - self._pending_rows
+            part = batch.slice(offset, room)
+            offset += part.num_rows
+            self._pending.append(part)
+            self._pending_rows += part.num_rows
+
+            if self._pending_rows >= self.row_group_size:
+                self._flush_row_group()
+            if self._file_rows + self._pending_rows >= self.chunk_size:
+                self._flush_row_group()
+                self._close_file()
+
+    def _flush_row_group(self) -> None:
+        if not self._pending:
+            return
+        if self._writer is None:
+            self._idx += 1
+            self._path = f"{self.prefix}_{self._idx:04d}.parquet"
+            self._writer = pq.ParquetWriter(self._path, self.schema,
+                                            compression=self.compression)
+        table = pa.Table.from_batches(self._pending, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self._file_rows += self._pending_rows
+        self._pending = []
+        self._pending_rows = 0
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        self.files.append((self._path, self._file_rows))
+        self.total_rows += self._file_rows
+        if self.on_file:
+            self.on_file(self._path, self._file_rows)
+        self._file_rows = 0
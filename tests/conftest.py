@@ -0,0 +1,86 @@
+# tests/conftest.py
+"""
+Synthetic (regtest-difficulty) blocks so the parsing / indexing suites can
+run without a synced node.
+"""
+
+import struct
+
+import pytest
+from bitcoin.core import (
+    CBlock, CMutableTransaction, CMutableTxIn, CMutableTxOut, COutPoint,
+    CScriptWitness, CTxInWitness, CTxWitness, lx,
+)
+from bitcoin.core.script import CScript
+
+from framework_bt.blockparser import sha256d
+
+REGTEST_BITS = 0x207FFFFF
+REGTEST_TARGET = 0x7FFFFF << (8 * (0x20 - 3))
+
+SCRIPTS = [
+    bytes.fromhex("76a914" + "11" * 20 + "88ac"),        # P2PKH
+    bytes.fromhex("a914" + "22" * 20 + "87"),            # P2SH
+    bytes.fromhex("0014" + "33" * 20),                   # P2WPKH
+    bytes.fromhex("0020" + "44" * 32),                   # P2WSH
+    bytes.fromhex("5120" + "55" * 32),                   # P2TR
+    bytes.fromhex("21" + "02" + "66" * 32 + "ac"),       # P2PK
+    bytes.fromhex("6a0b68656c6c6f20776f726c64"),         # OP_RETURN
+]
+
+
+def make_coinbase(height: int, value: int = 50 * 100_000_000):
+    txin = CMutableTxIn(COutPoint(), CScript(struct.pack("<I", height) + b"\x01"))
+    return CMutableTransaction([txin], [CMutableTxOut(value, CScript(SCRIPTS[0]))])
+
+
+def make_spend(seed: int, scripts=SCRIPTS, witness: bool = False):
+    prev = COutPoint(lx(f"{seed:064x}"), 0)
+    txin = CMutableTxIn(prev, CScript(b"" if witness else b"\x01\x02"))
+    outs = [CMutableTxOut(1000 + i, CScript(s)) for i, s in enumerate(scripts)]
+    tx = CMutableTransaction([txin], outs)
+    if witness:
+        tx.wit = CTxWitness([CTxInWitness(CScriptWitness([b"\x30" * 71, b"\x02" * 33]))])
+    return tx
+
+
+def mine_block(prev_hash: bytes, txs, *, time: int = 1_600_000_000,
+               bits: int = REGTEST_BITS) -> bytes:
+    """Returns the raw serialization of a block with valid regtest PoW."""
+    nonce = 0
+    while True:
+        blk = CBlock(hashPrevBlock=prev_hash, nTime=time, nBits=bits,
+                     nNonce=nonce, vtx=txs)
+        blk = CBlock(hashPrevBlock=prev_hash, nTime=time, nBits=bits,
+                     nNonce=nonce, vtx=txs,
+                     hashMerkleRoot=blk.calc_merkle_root())
+        raw = blk.serialize()
+        if int.from_bytes(sha256d(raw[:80]), "little") <= REGTEST_TARGET:
+            return raw
+        nonce += 1
+
+
+def make_chain(n: int, *, prev_hash: bytes = b"\x00" * 32, start_height: int = 0,
+               spends_per_block: int = 2, time: int = 1_600_000_000):
+    """Builds `n` linked blocks. Returns list of raw blocks."""
+    chain = []
+    for i in range(n):
+        h = start_height + i
+        txs = [make_coinbase(h)]
+        for j in range(spends_per_block):
+            txs.append(make_spend(h * 100 + j + 1, witness=bool(j % 2)))
+        raw = mine_block(prev_hash, txs, time=time + 600 * i)
+        chain.append(raw)
+        prev_hash = sha256d(raw[:80])
+    return chain
+
+
+def write_blk_file(path, blocks, magic=b"\xf9\xbe\xb4\xd9"):
+    with open(path, "wb") as f:
+        for raw in blocks:
+            f.write(magic + struct.pack("<I", len(raw)) + raw)
+
+
+@pytest.fixture(scope="session")
+def chain():
+    return make_chain(12)
@@ -0,0 +1,48 @@
+from bitcoin.core import CBlock, CTransaction, b2lx
+
+from framework_bt.blockparser import block_hash, block_time, iter_block_txs, parse_tx
+from framework_bt.classifier import StandardClassifier
+from framework_bt.extractor import extract
+
+
+def test_parser_matches_bitcoinlib(chain):
+    for raw in chain:
+        blk = CBlock.deserialize(raw)
+        assert block_hash(raw) == b2lx(blk.GetHash())
+        assert block_time(raw) == blk.nTime
+
+        views = list(iter_block_txs(raw))
+        assert len(views) == len(blk.vtx)
+        for view, tx in zip(views, blk.vtx):
+            base = len(tx.serialize({"include_witness": False}))
+            total = len(tx.serialize())
+            assert view.txid == b2lx(tx.GetTxid())
+            assert view.vin_count == len(tx.vin)
+            assert view.is_segwit == (not tx.wit.is_null())
+            assert (view.base_size, view.total_size) == (base, total)
+            assert view.weight == base * 3 + total
+            assert [(v, bytes(s)) for v, s in view.outputs] == [
+                (o.nValue, bytes(o.scriptPubKey)) for o in tx.vout
+            ]
+        assert views[0].is_coinbase and not any(v.is_coinbase for v in views[1:])
+
+
+def test_parse_single_tx(chain):
+    tx = CBlock.deserialize(chain[0]).vtx[2]
+    view, end = parse_tx(tx.serialize())
+    assert end == len(tx.serialize())
+    assert view.txid == b2lx(tx.GetTxid())
+
+
+def test_extract_raw_and_hex_agree(chain):
+    clf = StandardClassifier()
+    raw_src = [{"height": h, "raw": raw} for h, raw in enumerate(chain)]
+    hex_src = [
+        {"height": h, "time": CBlock.deserialize(raw).nTime,
+         "txs": [tx.serialize().hex() for tx in CBlock.deserialize(raw).vtx]}
+        for h, raw in enumerate(chain)
+    ]
+    rows_raw = list(extract(raw_src, clf, processes=1))
+    rows_hex = list(extract(hex_src, clf, processes=1))
+    assert rows_raw == rows_hex
+    assert {r["type"] for r in rows_raw} >= {"COINBASE", "P2PKH", "P2WPKH", "P2TR", "OP_RETURN"}
@@ -0,0 +1,26 @@
+import pyarrow.parquet as pq
+from click.testing import CliRunner
+
+from conftest import write_blk_file
+from framework_bt.cli import main
+
+
+def test_blk_dir_to_parquet_chunks(chain, tmp_path):
+    blk_dir = tmp_path / "blocks"
+    blk_dir.mkdir()
+    write_blk_file(blk_dir / "blk00000.dat", chain)
+    out = tmp_path / "utxos"
+
+    res = CliRunner().invoke(main, [
+        "--blk-dir", str(blk_dir), "--start-height", "0", "--end-height", "11",
+        "--processes", "2", "--output", str(out), "--chunk-size", "50",
+    ])
+    assert res.exit_code == 0, res.output
+
+    files = sorted(tmp_path.glob("utxos_*.parquet"))
+    rows = [pq.read_table(f).num_rows for f in files]
+    assert rows[:-1] == [50] * (len(rows) - 1)
+    assert sum(rows) == 12 * 15
+
+    heights = [h for f in files for h in pq.read_table(f, columns=["height"])["height"].to_pylist()]
+    assert heights == sorted(heights)
@@ -0,0 +1,35 @@
+from framework_bt.classifier import StandardClassifier
+from framework_bt.extractor import extract
+
+
+def _source(chain, consumed):
+    for h, raw in enumerate(chain):
+        consumed.append(h)
+        yield {"height": h, "raw": raw}
+
+
+def test_window_bounds_source_reads(chain):
+    consumed = []
+    rows = extract(_source(chain, consumed), StandardClassifier(),
+                   processes=2, max_inflight=2)
+    first = next(rows)
+    assert first["height"] == 0
+    assert len(consumed) <= 3
+    rows.close()
+
+
+def test_ordered_and_unordered_match_serial(chain):
+    clf = StandardClassifier()
+    serial = list(extract(_source(chain, []), clf, processes=1))
+    ordered = list(extract(_source(chain, []), clf, processes=2, max_inflight=3))
+    unordered = list(extract(_source(chain, []), clf, processes=2,
+                             max_inflight=3, ordered=False))
+    assert ordered == serial
+    key = lambda r: (r["height"], r["tx_id"], r["vout"])
+    assert sorted(unordered, key=key) == sorted(serial, key=key)
+
+
+def test_height_filter(chain):
+    rows = list(extract(_source(chain, []), StandardClassifier(), processes=1,
+                        start_height=3, end_height=4))
+    assert {r["height"] for r in rows} == {3, 4}
@@ -0,0 +1,43 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from framework_bt.classifier import StandardClassifier
+from framework_bt.extractor import extract_batches
+from framework_bt.schema import UTXO_SCHEMA
+from framework_bt.writer import ParquetChunkWriter
+
+
+def _batches(chain):
+    src = [{"height": h, "raw": raw} for h, raw in enumerate(chain)]
+    return list(extract_batches(src, StandardClassifier(), processes=1))
+
+
+def test_chunks_and_row_groups(chain, tmp_path):
+    batches = _batches(chain)
+    expected = pa.Table.from_batches(batches)
+    seen = []
+    with ParquetChunkWriter(str(tmp_path / "u"), chunk_size=40, row_group_size=16,
+                            compression="zstd",
+                            on_file=lambda p, n: seen.append(n)) as w:
+        for b in batches:
+            w.write(b)
+
+    assert [n for _, n in w.files] == seen
+    assert seen[:-1] == [40] * (len(seen) - 1) and sum(seen) == expected.num_rows
+
+    first = pq.ParquetFile(w.files[0][0])
+    assert first.metadata.num_row_groups == 3
+    assert first.metadata.row_group(0).column(0).compression == "ZSTD"
+
+    got = pa.concat_tables(pq.read_table(p) for p, _ in w.files)
+    assert got.schema.field("type").type == UTXO_SCHEMA.field("type").type
+    assert got.to_pylist() == expected.to_pylist()
+
+
+def test_writer_error_surfaces(tmp_path):
+    w = ParquetChunkWriter(str(tmp_path / "missing" / "u"), chunk_size=10)
+    w.write(pa.RecordBatch.from_pylist(
+        [{"height": 1, "vout": 0, "value": 5, "type": "P2PKH"}], schema=UTXO_SCHEMA))
+    with pytest.raises(RuntimeError):
+        w.close()